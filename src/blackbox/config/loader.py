@@ -1,20 +1,151 @@
-from dataclasses import asdict
+import copy
+import os
+import types
+from dataclasses import MISSING, asdict, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, Literal, Union, get_args, get_origin, get_type_hints
 
 import yaml
-from dacite import from_dict
 
 from blackbox.config.schema import BacktestConfig
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+# Hydration functions per dataclass, built once on first use
+_builders: dict[type, Callable[[dict], Any]] = {}
+
+
+def _dataclass_type(tp: Any) -> type | None:
+    """Return the dataclass behind `tp` (unwrapping Optional[...]), if any."""
+    if get_origin(tp) in (Union, types.UnionType):
+        args = [a for a in get_args(tp) if a is not type(None)]
+        tp = args[0] if len(args) == 1 else None
+    return tp if isinstance(tp, type) and is_dataclass(tp) else None
+
+
+def _accepted_types(tp: Any) -> tuple[type, ...] | None:
+    """
+    Flatten a field annotation into the runtime types an isinstance check accepts,
+    or None when it cannot be checked (Any). Generics check their origin only, and
+    float also accepts int, as YAML writes whole numbers without a decimal point.
+    """
+    if tp is Any:
+        return None
+    if get_origin(tp) in (Union, types.UnionType):
+        accepted: tuple[type, ...] = ()
+        for arg in get_args(tp):
+            sub = _accepted_types(arg)
+            if sub is None:
+                return None
+            accepted += sub
+        return accepted
+    if tp is None or tp is type(None):
+        return (type(None),)
+    if tp is float:
+        return (float, int)
+    if get_origin(tp) is Literal:
+        return tuple(dict.fromkeys(type(arg) for arg in get_args(tp)))
+    origin = get_origin(tp)
+    if isinstance(origin, type):
+        return (origin,)
+    return (tp,) if isinstance(tp, type) else None
+
+
+def _type_name(accepted: tuple[type, ...]) -> str:
+    return " | ".join(t.__name__ for t in accepted)
+
+
+def make_builder(cls: type) -> Callable[[dict], Any]:
+    """
+    Introspect `cls` once and return a function that hydrates it from a raw dict.
+    Nested dataclass fields are built recursively; unknown keys are ignored, and
+    values whose type does not match the field annotation raise ValueError.
+    """
+    hints = get_type_hints(cls)
+    cls_fields = fields(cls)
+    names = frozenset(f.name for f in cls_fields)
+    required = [
+        f.name for f in cls_fields if f.default is MISSING and f.default_factory is MISSING
+    ]
+    nested = {
+        f.name: sub for f in cls_fields if (sub := _dataclass_type(hints[f.name])) is not None
+    }
+    checks = {
+        f.name: accepted
+        for f in cls_fields
+        if (accepted := _accepted_types(hints[f.name])) is not None
+    }
+    choices = {
+        f.name: get_args(hints[f.name]) for f in cls_fields if get_origin(hints[f.name]) is Literal
+    }
+
+    def build(raw: dict) -> Any:
+        missing = [name for name in required if name not in raw]
+        if missing:
+            raise ValueError(f"❌ Missing required fields for {cls.__name__}: {missing}")
+
+        kwargs = {key: value for key, value in raw.items() if key in names}
+        for name, sub in nested.items():
+            value = kwargs.get(name)
+            if isinstance(value, dict):
+                kwargs[name] = get_builder(sub)(value)
+
+        for name, value in kwargs.items():
+            accepted = checks.get(name)
+            if accepted is None:
+                continue
+            # bool subclasses int, but `true` is never a valid count or amount
+            if not isinstance(value, accepted) or (
+                isinstance(value, bool) and bool not in accepted
+            ):
+                raise ValueError(
+                    f"❌ Wrong type for {cls.__name__}.{name}: expected "
+                    f"{_type_name(accepted)}, got {type(value).__name__} ({value!r})"
+                )
+            if name in choices and value not in choices[name]:
+                raise ValueError(
+                    f"❌ Invalid value for {cls.__name__}.{name}: expected one of "
+                    f"{list(choices[name])}, got {value!r}"
+                )
+        return cls(**kwargs)
+
+    return build
+
+
+def get_builder(cls: type) -> Callable[[dict], Any]:
+    builder = _builders.get(cls)
+    if builder is None:
+        builder = _builders[cls] = make_builder(cls)
+    return builder
+
+
+@lru_cache(maxsize=64)
+def _load_cached(path: str, file_id: tuple[int, int, int, int]) -> BacktestConfig:
+    """
+    Parse and hydrate a config file. Keyed on the (device, inode, mtime, size)
+    of the file the path points to, so edits and retargeted symlinks invalidate
+    the entry.
+    """
+    raw = yaml.load(Path(path).read_text(), Loader=_Loader)
+    return get_builder(BacktestConfig)(raw)
+
 
 def load_config(path: str | Path) -> BacktestConfig:
-    path = Path(path)
-    with open(path, "r") as f:
-        raw = yaml.safe_load(f)
+    stat = os.stat(path)  # follows symlinks
+    config = _load_cached(
+        str(path), (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    )
 
-    return from_dict(data_class=BacktestConfig, data=raw)
+    # Hand out a private copy so per-run mutations never leak into the cache
+    return copy.deepcopy(config)
 
 
 def dump_config(config: BacktestConfig, path: Path):
     with open(path, "w") as f:
-        yaml.safe_dump(asdict(config), f)
+        yaml.dump(asdict(config), f, Dumper=_Dumper, sort_keys=False)
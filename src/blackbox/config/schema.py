@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 
 @dataclass
@@ -48,6 +48,8 @@ class BacktestConfig:
     settlement_delay: int = 2
     plot_equity: bool = True
     risk_free_rate: float = 0.0
+    n_workers: Optional[int] = None  # processes for BacktestEngine.run_sweep; None = CPU count
+    weight_dtype: Literal["float32", "float64"] = "float64"  # float32 halves trade/weight logs
 
     # Logging
     log_level: str = "INFO"
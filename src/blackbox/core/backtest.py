@@ -1,14 +1,25 @@
+import logging
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from time import monotonic
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 
 from blackbox.config.loader import dump_config
 from blackbox.config.schema import BacktestConfig
-from blackbox.core.execution_loop import DailyLog, TradeResult, reconcile_trades, simulate_execution
+from blackbox.core.execution_loop import (
+    DailyLogBuffer,
+    TradeResult,
+    reconcile_trades,
+    simulate_execution,
+)
+from blackbox.models.factory import build_models
 from blackbox.models.interfaces import (
     AlphaModel,
     ExecutionModel,
@@ -18,9 +29,63 @@ from blackbox.models.interfaces import (
 )
 from blackbox.models.tracker import PositionTracker
 from blackbox.research.metrics import PerformanceMetrics
-from blackbox.utils.context import get_feature_matrix, get_logger
+from blackbox.utils.context import get_feature_matrix, get_logger, set_logger
 from blackbox.utils.logger import RichLogger
 
+# Shared inputs for run_sweep() workers, installed once per process by the initializer
+_sweep_data: list[dict] = []
+_sweep_features: Optional[pd.DataFrame] = None
+
+
+def _init_sweep_worker(data: list[dict], feature_matrix: Optional[pd.DataFrame]) -> None:
+    global _sweep_data, _sweep_features
+    _sweep_data = data
+    _sweep_features = feature_matrix
+
+
+def _run_sweep_config(config: BacktestConfig) -> dict:
+    """Build models for one config and backtest it on the worker's shared data."""
+    # Models grab the context logger at construction; workers log to their own console only
+    set_logger(
+        RichLogger(
+            level=config.log_level,
+            log_to_console=config.log_to_console,
+            log_to_file=False,
+            structured=config.structured_logging,
+        )
+    )
+    alpha, risk, cost, portfolio, execution = build_models(config)
+    engine = BacktestEngine(
+        config,
+        alpha,
+        risk,
+        cost,
+        portfolio,
+        execution,
+        min_holding_period=config.min_holding_period,
+        risk_free_rate=config.risk_free_rate,
+        plot_equity=False,
+    )
+    engine.run(_sweep_data, _sweep_features)
+    return engine.generate_metrics()
+
+
+def _nonzero(series: pd.Series) -> pd.Series:
+    """Return the non-zero entries of `series`, gathered by position."""
+    return series.iloc[np.flatnonzero(series.to_numpy())]
+
+
+def _top_k(series: pd.Series, k: int = 5) -> dict:
+    """Return the k entries with the largest |value| as {symbol: value}, largest first."""
+    values = series.to_numpy()
+    k = min(k, values.size)
+    if k == 0:
+        return {}
+    magnitudes = np.abs(values)
+    top = np.argpartition(magnitudes, -k)[-k:]
+    top = top[np.argsort(-magnitudes[top])]
+    return dict(zip(series.index[top], values[top].tolist(), strict=True))
+
 
 class BacktestEngine:
     def __init__(
@@ -53,22 +118,65 @@ class BacktestEngine:
         self.initial_equity = initial_equity or config.initial_portfolio_value
         self.risk_free_rate = risk_free_rate
         self.plot_equity = plot_equity
-        self.daily_logs: list[DailyLog] = []
-        # Set the execution model's portfolio value to match
-        if hasattr(execution, "portfolio_value"):
-            execution.portfolio_value = self.initial_equity
-        if hasattr(execution, "current_cash"):
-            execution.current_cash = self.initial_equity
+        self.metrics = PerformanceMetrics(
+            initial_value=self.initial_equity,
+            risk_free_rate=self.risk_free_rate,
+        )
+        self.daily_logs = DailyLogBuffer(pd.Index([], name="symbol"))
+        self._signals_by_date: Optional[dict[pd.Timestamp, pd.Series]] = None
+        self._equity_dates = pd.DatetimeIndex([])
+        self._equity = np.empty(0)
+        # Seed the execution model's book; set unconditionally so the day loop can read
+        # execution.portfolio_value directly for any ExecutionModel
+        execution.portfolio_value = self.initial_equity
+        execution.current_cash = self.initial_equity
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         self.output_dir = Path("results") / config.run_id / timestamp
         self.output_dir.mkdir(parents=True, exist_ok=True)
         dump_config(config, self.output_dir / "config.yaml")
 
-    def run(self, data: list[dict], feature_matrix: Optional[pd.DataFrame] = None) -> pd.DataFrame:
-        # Track account equity by date
-        self.equity_by_date = {}
+    @classmethod
+    def run_sweep(
+        cls,
+        configs: list[BacktestConfig],
+        data: list[dict],
+        feature_matrix: Optional[pd.DataFrame] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Backtest independent configs (e.g. a parameter grid) in worker processes.
+        Data and features are shipped to each worker once, not once per config.
+        max_workers defaults to the first config's n_workers (None = CPU count).
+        Returns the metrics dict for each config, in input order.
+
+        Each config runs as "<run_id>_<index>", so grid members copied from one
+        base config get their own output directory and config dump. Workers
+        always run with plot_equity=False and log_to_file=False.
+        """
+        if max_workers is None and configs:
+            max_workers = configs[0].n_workers
+
+        # Copies, so the caller's configs keep their run_id
+        configs = [
+            replace(config, run_id=f"{config.run_id}_{i}") for i, config in enumerate(configs)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_sweep_worker,
+            initargs=(data, feature_matrix),
+        ) as pool:
+            return list(pool.map(_run_sweep_config, configs))
+
+    @property
+    def equity_by_date(self) -> dict[pd.Timestamp, float]:
+        """Equity recorded for each simulated day of the last run."""
+        recorded = ~np.isnan(self._equity)
+        return dict(
+            zip(self._equity_dates[recorded], self._equity[recorded].tolist(), strict=True)
+        )
 
+    def run(self, data: list[dict], feature_matrix: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         self.logger.info(f"📊 Backtest start | {len(data)} trading days")
 
         if feature_matrix is None:
@@ -81,16 +189,25 @@ class BacktestEngine:
                 feature_matrix.reset_index()
                 .assign(date=lambda df: pd.to_datetime(df["date"]).dt.normalize())
                 .set_index(["date", "symbol"])
-                .sort_index()
             )
 
-        # Force MultiIndex to be unique, sorted, and correct type
-        feature_matrix.index = pd.MultiIndex.from_tuples(
-            [(pd.Timestamp(date), symbol) for date, symbol in feature_matrix.index],
-            names=["date", "symbol"],
-        )
-        feature_matrix = feature_matrix.sort_index()
+        # Force MultiIndex to be unique, sorted, and correct type; the date level
+        # is converted in one vectorized call, and only if it isn't datetime64 yet
+        date_level = feature_matrix.index.get_level_values("date")
+        if not isinstance(date_level, pd.DatetimeIndex):
+            feature_matrix.index = pd.MultiIndex.from_arrays(
+                [pd.to_datetime(date_level), feature_matrix.index.get_level_values("symbol")],
+                names=["date", "symbol"],
+            )
+        # Only sort when needed, so repeated runs keep the caller's matrix object
+        if not feature_matrix.index.is_monotonic_increasing:
+            feature_matrix = feature_matrix.sort_index()
         assert feature_matrix.index.is_unique, "Feature matrix index is not unique!"
+        # Index invariants for the whole run; logged once rather than every day
+        self.logger.debug(f"feature_matrix.index.is_unique: {feature_matrix.index.is_unique}")
+        self.logger.debug(
+            f"feature_matrix.index.is_monotonic_increasing: {feature_matrix.index.is_monotonic_increasing}"
+        )
 
         # Safely sort unique dates
         feature_dates = (
@@ -109,21 +226,43 @@ class BacktestEngine:
         )
 
         # Defensive: Compare data dates and feature matrix dates
-        feature_matrix_dates = set(feature_matrix.index.get_level_values("date").unique())
-        data_dates = set(pd.to_datetime([snap["date"] for snap in data]).normalize().unique())
-        missing_in_features = sorted(data_dates - feature_matrix_dates)
-        if missing_in_features:
+        # The date level was made datetime64 above, so this wrap does not convert
+        feature_matrix_dates = pd.DatetimeIndex(
+            feature_matrix.index.get_level_values("date").unique()
+        )
+        # Parse and normalize every snapshot date once; everything below indexes this
+        run_dates = pd.DatetimeIndex(pd.to_datetime([snap["date"] for snap in data])).normalize()
+        missing_in_features = run_dates.unique().difference(feature_matrix_dates)
+        if len(missing_in_features):
             self.logger.warning(
-                f"⚠️ {len(missing_in_features)} dates in data but missing in feature matrix: {missing_in_features[:10]} ..."
+                f"⚠️ {len(missing_in_features)} dates in data but missing in feature matrix: "
+                f"{missing_in_features[:10].tolist()} ..."
+            )
+
+        # Row positions of each date's block, from one groupby; frames are only
+        # sliced out for the dates this run actually visits
+        feature_rows = feature_matrix.groupby(level="date", sort=False).indices
+
+        # Alpha models that can score the whole matrix at once skip per-day generate()
+        self._signals_by_date = None
+        generate_batch = getattr(self.alpha, "generate_batch", None)
+        if generate_batch is not None:
+            batch_signals = generate_batch(feature_matrix)
+            self._signals_by_date = {
+                date: signals.droplevel("date")
+                for date, signals in batch_signals.groupby(level="date", sort=False)
+            }
+            self.logger.info(
+                f"⚡ Precomputed alpha signals for {len(self._signals_by_date)} dates"
             )
 
-        # Determine warmup period based on when feature data becomes available
-        min_feature_date = min(feature_matrix_dates)
-        data_with_dates = [(pd.to_datetime(snap["date"]).normalize(), snap) for snap in data]
-        data_with_dates.sort(key=lambda x: x[0])  # Sort by date
+        # Determine warmup period based on when feature data becomes available; the
+        # matrix is sorted by (date, symbol) above, so its first row has the earliest date
+        min_feature_date = feature_matrix.index.get_level_values("date")[0]
 
         # Determine the first date when we have feature data
-        warmup_days = sum(1 for date, _ in data_with_dates if date < min_feature_date)
+        warmup = np.asarray(run_dates < min_feature_date)
+        warmup_days = int(warmup.sum())
 
         if warmup_days > 0:
             self.logger.info(
@@ -132,13 +271,14 @@ class BacktestEngine:
 
         # Construct full OHLCV dataframe for easier lookups
         # FIX: Handle the case where date column already exists in the index or DataFrame
-        frames = [
-            snap["ohlcv"]
-            for snap in data
+        frame_days = [
+            i
+            for i, snap in enumerate(data)
             if "ohlcv" in snap
             and isinstance(snap["ohlcv"], pd.DataFrame)
             and not snap["ohlcv"].empty
         ]
+        frames = [data[i]["ohlcv"] for i in frame_days]
 
         if frames:
             # Check the structure of the frames to determine how to process them
@@ -163,48 +303,52 @@ class BacktestEngine:
             elif isinstance(sample_frame.index, pd.MultiIndex):
                 # Has a MultiIndex but different names
                 self.logger.debug(f"OHLCV has MultiIndex with names: {sample_frame.index.names}")
-                # Rename index levels if needed and combine
-                frames_with_correct_names = []
-                for frame in frames:
-                    if frame.index.names != ["date", "symbol"]:
-                        frame = frame.copy()
-                        frame.index.names = ["date", "symbol"]
-                    frames_with_correct_names.append(frame)
-                ohlcv_df = pd.concat(frames_with_correct_names)
+                # Combine, then name the levels once instead of copying each frame
+                ohlcv_df = pd.concat(frames)
+                ohlcv_df.index = ohlcv_df.index.set_names(["date", "symbol"])
             else:
                 # Some other structure - try adding date from snapshot
                 self.logger.debug("OHLCV has non-standard structure, adding date from snapshots")
-                new_frames = []
-                for i, frame in enumerate(frames):
-                    date = pd.to_datetime(data[i]["date"]).normalize()
-                    if not isinstance(frame.index, pd.MultiIndex):
+                # Build the (date, symbol) level arrays per frame, then concat the
+                # values once and attach the index, rather than re-indexing each frame
+                date_parts, symbol_parts = [], []
+                for pos, frame in zip(frame_days, frames, strict=True):
+                    if isinstance(frame.index, pd.MultiIndex):
+                        date_parts.append(frame.index.get_level_values(0))
+                        symbol_parts.append(frame.index.get_level_values(1).to_numpy())
+                    else:
                         # Assume index is symbol
-                        frame = frame.copy()
-                        frame.index.name = "symbol"
-                        frame = frame.reset_index()
-                        frame["date"] = date
-                        frame = frame.set_index(["date", "symbol"])
-                    new_frames.append(frame)
-                ohlcv_df = pd.concat(new_frames)
+                        date = run_dates[pos]
+                        date_parts.append(pd.DatetimeIndex([date]).repeat(len(frame)))
+                        symbol_parts.append(frame.index.to_numpy())
+                ohlcv_df = pd.concat(frames, ignore_index=True)
+                ohlcv_df.index = pd.MultiIndex.from_arrays(
+                    [date_parts[0].append(date_parts[1:]), np.concatenate(symbol_parts)],
+                    names=["date", "symbol"],
+                )
 
             # Ensure all dates are normalized
             if isinstance(ohlcv_df.index, pd.MultiIndex):
-                dates = ohlcv_df.index.get_level_values("date")
+                dates = pd.to_datetime(ohlcv_df.index.get_level_values("date")).normalize()
                 symbols = ohlcv_df.index.get_level_values("symbol")
-                ohlcv_df.index = pd.MultiIndex.from_tuples(
-                    [(pd.to_datetime(d).normalize(), s) for d, s in zip(dates, symbols)],
-                    names=["date", "symbol"],
+                ohlcv_df.index = pd.MultiIndex.from_arrays(
+                    [dates, symbols], names=["date", "symbol"]
                 )
-                ohlcv_df = ohlcv_df.sort_index()
+                if not ohlcv_df.index.is_monotonic_increasing:
+                    ohlcv_df = ohlcv_df.sort_index()
 
             self.logger.info(f"Combined OHLCV dataframe: {ohlcv_df.shape} rows")
         else:
             ohlcv_df = pd.DataFrame()
             self.logger.warning("⚠️ No OHLCV data found in snapshots")
 
+        # Per-date OHLCV row positions for the fix-up below; grouped once, on first use
+        has_date_level = isinstance(ohlcv_df.index, pd.MultiIndex)
+        ohlcv_rows: Optional[dict[pd.Timestamp, np.ndarray]] = None
+
         # Enhanced validation - check if each snapshot has required data
         for i, snapshot in enumerate(data):
-            date = pd.to_datetime(snapshot["date"]).normalize()
+            date = run_dates[i]
 
             # Debug: log what's in the snapshot
             if i < 5:  # Just log first few days to avoid spamming
@@ -238,7 +382,16 @@ class BacktestEngine:
                 or snapshot["ohlcv"] is None
                 or (isinstance(snapshot["ohlcv"], pd.DataFrame) and snapshot["ohlcv"].empty)
             ):
-                if not ohlcv_df.empty:
+                if has_date_level:
+                    if ohlcv_rows is None:
+                        ohlcv_rows = ohlcv_df.groupby(level="date", sort=False).indices
+                    rows = ohlcv_rows.get(date)
+                    if rows is not None:
+                        snapshot["ohlcv"] = ohlcv_df.iloc[rows].droplevel("date")
+                        self.logger.debug(f"Added OHLCV data to snapshot for {date.date()}")
+                    else:
+                        self.logger.warning(f"No OHLCV data available for {date.date()}")
+                elif not ohlcv_df.empty:
                     try:
                         # Extract for this date
                         date_data = ohlcv_df.loc[date]
@@ -247,6 +400,35 @@ class BacktestEngine:
                     except KeyError:
                         self.logger.warning(f"No OHLCV data available for {date.date()}")
 
+        # Align every day's prices on a fixed symbol universe once, up front; the
+        # daily logs then store these rows as-is instead of re-aligning each day
+        price_rows, universe = self._to_soa(data)
+        self.daily_logs = DailyLogBuffer(
+            universe, capacity=len(data), weight_dtype=self.config.weight_dtype
+        )
+
+        # Track account equity by day position; NaN until a day is simulated
+        self._equity_dates = run_dates
+        self._equity = np.full(len(data), np.nan)
+        equity = self._equity
+
+        # Per-day feature rows, aligned to `data` by position like `warmup`
+        day_features = [
+            feature_matrix.iloc[rows].droplevel("date")
+            if (rows := feature_rows.get(date)) is not None
+            else None
+            for date in run_dates
+        ]
+
+        # Only post-warmup days with a feature row are simulated; skipped days are
+        # reported once here instead of once per day inside the loop
+        runnable = [i for i in np.flatnonzero(~warmup).tolist() if day_features[i] is not None]
+        unfeatured = len(data) - warmup_days - len(runnable)
+        if unfeatured:
+            self.logger.warning(
+                f"⚠️ Skipping {unfeatured} post-warmup days missing from the feature matrix"
+            )
+
         equity_so_far = self.initial_equity
         any_trades_executed = False
         positions_built = False
@@ -257,95 +439,100 @@ class BacktestEngine:
             "[progress.percentage]{task.percentage:>3.0f}%",
             TimeElapsedColumn(),
             TimeRemainingColumn(),
+            # Nothing to animate when output isn't a terminal (CI, log files, workers)
+            disable=not self.logger.console.is_terminal,
         ) as progress:
-            task = progress.add_task("Backtesting", total=len(data))
-
-            for snapshot in data:
-                date = pd.to_datetime(snapshot["date"]).normalize()
-                prices = snapshot["prices"]
-
-                # Progress bar description shows current date and equity
-                if equity_so_far is not None:
-                    progress.update(task, description=f"{date.date()} | ${equity_so_far:.2f}")
-                else:
-                    progress.update(task, description=f"{date.date()}")
+            task = progress.add_task("Backtesting", total=len(runnable))
+
+            # Bind per-day callables once; the loop body runs for every snapshot
+            logger = self.logger
+            alpha_signals = self._alpha_signals
+            construct = self.portfolio.construct
+            simulate_day = self._simulate_day
+            update_progress = progress.update
+            advance_progress = progress.advance
+            last_day = runnable[-1] if runnable else -1
+            last_refresh = float("-inf")
+
+            for i in runnable:
+                snapshot = data[i]
+                date = run_dates[i]
+
+                # Progress bar description shows current date and equity; it is only
+                # re-formatted every 100ms (and on the last day), the bar advances every day
+                now = monotonic()
+                if now - last_refresh >= 0.1 or i == last_day:
+                    last_refresh = now
+                    if equity_so_far is not None:
+                        update_progress(task, description=f"{date.date()} | ${equity_so_far:.2f}")
+                    else:
+                        update_progress(task, description=f"{date.date()}")
 
-                progress.advance(task)
+                advance_progress(task)
 
                 try:
-                    self.logger.debug(
-                        f"feature_matrix.index.is_unique: {feature_matrix.index.is_unique}"
-                    )
-                    self.logger.debug(
-                        f"feature_matrix.index.is_monotonic_increasing: {feature_matrix.index.is_monotonic_increasing}"
-                    )
-
-                    # Check if in warmup period
-                    is_warmup = date < min_feature_date
-                    if is_warmup:
-                        self.logger.info(f"{date.date()} | 🔄 Warmup day (no features yet)")
-                        continue
-
-                    # Check if date exists in feature matrix
-                    if date not in feature_matrix_dates:
-                        self.logger.warning(
-                            f"{date.date()} | ⚠️ Date missing from feature matrix, skipping."
-                        )
-                        continue
+                    features = day_features[i]
 
-                    # Get features for this date
-                    try:
-                        snapshot["feature_vector"] = feature_matrix.loc[date]
-                    except KeyError as e:
-                        self.logger.error(f"KeyError for date {date}: {e}")
-                        raise
+                    # Per-day view for the models; the caller's snapshot is left untouched
+                    day = {**snapshot, "feature_vector": features, "capital": equity_so_far}
 
                     # Calculate alpha signals
-                    signals = self.alpha.predict(snapshot)
+                    signals = alpha_signals(date, day)
                     if signals.empty:
-                        self.logger.warning(f"{date.date()} | ⚠️ No alpha signals generated")
+                        logger.warning(f"{date.date()} | ⚠️ No alpha signals generated")
                         continue
 
-                    top_signals = signals.sort_values(ascending=False).head(5).to_dict()
-                    self.logger.info(
-                        f"{date.date()} | Alpha: {len(signals)} signals | Top: {top_signals}"
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "%s | Alpha: %d signals | Top: %s",
+                            date.date(),
+                            len(signals),
+                            _top_k(_nonzero(signals)),
+                        )
 
                     # Build portfolio
-                    # Add capital to the snapshot
-                    snapshot["capital"] = equity_so_far
-                    positions = self.portfolio.construct(signals, snapshot)
+                    positions = construct(signals, day)
 
                     # Track if we've built positions (out of warmup)
                     if not positions_built and not positions.empty:
                         positions_built = True
 
                     # Log exposure
-                    gross_exposure = abs(positions).sum() if isinstance(positions, pd.Series) else 0
-                    position_count = len(positions) if isinstance(positions, pd.Series) else 0
-                    self.logger.info(
-                        f"✅ Constructed {position_count} positions | Gross exposure: {gross_exposure:.2f}"
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        if isinstance(positions, pd.Series):
+                            gross_exposure = float(np.abs(positions.to_numpy()).sum())
+                            position_count = len(positions)
+                        else:
+                            gross_exposure, position_count = 0, 0
+                        logger.info(
+                            "✅ Constructed %d positions | Gross exposure: %.2f",
+                            position_count,
+                            gross_exposure,
+                        )
 
                     # Execute trades
-                    snapshot["capital"] = equity_so_far  # Ensure capital is in snapshot
-                    trades = self._simulate_day(date, snapshot, positions)
+                    trades = simulate_day(date, day, positions, signals, price_rows[i])
 
                     # Track whether any trades have been executed
                     if trades is not None and not any_trades_executed and not trades.empty:
                         any_trades_executed = True
 
                     # Update equity from internal tracking
-                    if date in self.equity_by_date:
-                        equity_so_far = self.equity_by_date[date]
+                    if trades is not None:
+                        # This is a simplified implementation - in reality would
+                        # calculate actual P&L
+                        equity[i] = self.initial_equity
+                        equity_so_far = equity[i]
 
                     if equity_so_far <= 0:
-                        self.logger.error(f"Capital is zero or negative: ${equity_so_far:.2f}")
+                        logger.error(f"Capital is zero or negative: ${equity_so_far:.2f}")
                         raise ValueError("Capital is zero")
 
                 except Exception as e:
-                    self.logger.error(f"{date.date()} | ⚠️ Exception: {e}")
-                    self.logger.error(traceback.format_exc())
+                    logger.error(f"{date.date()} | ⚠️ Exception: {type(e).__name__}: {e}")
+                    # Full stack only when debugging; formatting it walks every frame
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(traceback.format_exc())
 
         if not self.daily_logs:
             self.logger.error("❌ No trades executed — likely due to data issues")
@@ -358,42 +545,66 @@ class BacktestEngine:
 
             plot_equity_curve(self.daily_logs, self.config.run_id, self.output_dir)
 
-        return pd.DataFrame([log.__dict__ for log in self.daily_logs]).set_index("date")
+        return self.daily_logs.to_frame()
 
-    def _simulate_day(self, date: pd.Timestamp, snapshot: dict, positions: pd.Series):
+    @staticmethod
+    def _to_soa(data: list[dict]) -> tuple[np.ndarray, pd.Index]:
+        """
+        Split snapshot prices into struct-of-arrays form: a (day x symbol) float
+        price matrix and the symbol universe its columns are aligned on. NaN
+        marks a symbol without a price that day.
+        """
+        price_panel = pd.DataFrame([snap["prices"] for snap in data]).sort_index(axis=1)
+        return price_panel.to_numpy(dtype=float), price_panel.columns.rename("symbol")
+
+    def _simulate_day(
+        self,
+        date: pd.Timestamp,
+        snapshot: dict,
+        positions: pd.Series,
+        signals: pd.Series,
+        price_row: Optional[np.ndarray] = None,
+    ):
         # Get prices from the snapshot
         prices = snapshot["prices"]
 
-        # Re-generate signals to ensure consistency
-        signals = self.alpha.generate(snapshot)
-        tradable = signals.index.intersection(prices.index)
+        # Positional mask rather than intersection + .loc, which re-hashes the labels
+        tradable = signals.index.isin(prices.index)
 
-        if tradable.empty:
+        if not tradable.any():
             self.logger.warning(f"{date.date()} | No tradable signals")
             return
 
-        signals = signals.loc[tradable]
-        nonzero = signals[signals != 0]
-        top = nonzero.abs().sort_values(ascending=False).head(5)
+        signals = signals[tradable]
 
-        self.logger.info(f"{date.date()} | Alpha: {len(nonzero)} signals | Top: {top.to_dict()}")
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            nonzero = _nonzero(signals)
+            self.logger.info(
+                "%s | Alpha: %d signals | Top: %s",
+                date.date(),
+                len(nonzero),
+                _top_k(nonzero),
+            )
 
         current_portfolio = self.tracker.get_portfolio()
         risk_adjusted = self.risk.apply(signals, current_portfolio)
         self._log_state("Risk-adjusted", date, risk_adjusted)
 
         # DEBUG: Added detailed risk adjustment info
-        self.logger.info(
-            f"{date.date()} | From Alpha to Risk: {signals.abs().sum():.4f} → {risk_adjusted.abs().sum():.4f}"
-        )
+        if log_info:
+            self.logger.info(
+                f"{date.date()} | From Alpha to Risk: {signals.abs().sum():.4f} → {risk_adjusted.abs().sum():.4f}"
+            )
 
         cost_adjusted = self.cost.adjust(risk_adjusted, current_portfolio)
         self._log_state("Cost-adjusted", date, cost_adjusted)
 
         # DEBUG: Added detailed cost adjustment info
-        self.logger.info(
-            f"{date.date()} | From Risk to Cost: {risk_adjusted.abs().sum():.4f} → {cost_adjusted.abs().sum():.4f}"
-        )
+        if log_info:
+            self.logger.info(
+                f"{date.date()} | From Risk to Cost: {risk_adjusted.abs().sum():.4f} → {cost_adjusted.abs().sum():.4f}"
+            )
 
         # Make sure snapshot has capital value for portfolio construction
         if "capital" not in snapshot or snapshot["capital"] is None:
@@ -404,17 +615,26 @@ class BacktestEngine:
         self._log_state("Target", date, target_portfolio)
 
         # DEBUG: Added detailed portfolio construction info
-        self.logger.info(
-            f"{date.date()} | From Cost to Target: {cost_adjusted.abs().sum():.4f} → {target_portfolio.abs().sum():.4f}"
-        )
+        if log_info:
+            self.logger.info(
+                f"{date.date()} | From Cost to Target: {cost_adjusted.abs().sum():.4f} → {target_portfolio.abs().sum():.4f}"
+            )
+
+        # Flat book and nothing to hold: no trades, skip reconciliation and execution
+        if target_portfolio.empty and current_portfolio.empty:
+            self.logger.warning(
+                f"{date.date()} | No trades to execute. Current portfolio size: 0, Target size: 0"
+            )
+            return
 
         trades = reconcile_trades(current_portfolio, target_portfolio)
         self._log_state("Reconciled", date, trades)
 
         # DEBUG: Added detailed reconciliation info
-        self.logger.info(
-            f"{date.date()} | Reconciled: {len(trades)} trades | Notional: {trades.abs().sum():.4f}"
-        )
+        if log_info:
+            self.logger.info(
+                f"{date.date()} | Reconciled: {len(trades)} trades | Notional: {trades.abs().sum():.4f}"
+            )
 
         if trades.empty:
             self.logger.warning(
@@ -430,7 +650,8 @@ class BacktestEngine:
         )
 
         self._log_state("Executed", date, trade_result.executed)
-        self.logger.debug(f"{date.date()} | Feedback: {trade_result.feedback}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{date.date()} | Feedback: {trade_result.feedback}")
 
         filtered = self.tracker.filter(trade_result.executed, date, self.min_holding)
         self._log_state("Filtered", date, filtered)
@@ -444,35 +665,45 @@ class BacktestEngine:
         self.logger.info(f"{date.date()} | {len(filtered)} trades executed")
 
         # Create daily log entry
-        daily_log = DailyLog(
+        self.daily_logs.append(
             date=date,
-            prices=prices.copy(),
-            trades=filtered.copy(),
-            portfolio=updated.copy(),
-            feedback=trade_result.feedback.copy(),
+            prices=prices if price_row is None else price_row,
+            trades=filtered,
+            portfolio=updated,
+            feedback=trade_result.feedback,
         )
 
-        # Track equity for this date
-        # This is a simplified implementation - in reality would calculate actual P&L
-        self.equity_by_date[date] = self.initial_equity
+        return filtered
 
-        self.daily_logs.append(daily_log)
+    def _alpha_signals(self, date: pd.Timestamp, snapshot: dict) -> pd.Series:
+        if self._signals_by_date is None:
+            return self.alpha.predict(snapshot)
 
-        return filtered
+        signals = self._signals_by_date.get(date)
+        if signals is None:
+            return pd.Series(dtype=float)
+        return signals[signals.index.isin(snapshot["prices"].index)]
 
     def _log_state(self, label: str, date: pd.Timestamp, series: pd.Series):
-        nonzero = series[series != 0]
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        nonzero = _nonzero(series)
         if not nonzero.empty:
-            self.logger.debug(f"{date.date()} | {label}: {nonzero.to_dict()}")
+            # Largest entries only; a full dict is O(universe) per line
+            self.logger.debug(
+                "%s | %s: %d non-zero | Top: %s",
+                date.date(),
+                label,
+                len(nonzero),
+                _top_k(nonzero, k=10),
+            )
 
     def generate_metrics(self, return_equity: bool = False) -> dict:
         if not self.daily_logs:
             self.logger.error("❌ No daily logs available for metrics.")
             return {}
 
-        df = pd.DataFrame([log.__dict__ for log in self.daily_logs]).set_index("date")
-        metrics = PerformanceMetrics(
-            initial_value=self.initial_equity,
-            risk_free_rate=self.risk_free_rate,
+        panels = self.daily_logs.to_panels()
+        return self.metrics.compute_from_panels(
+            panels["prices"], panels["portfolio"], return_equity=return_equity
         )
-        return metrics.compute(df, return_equity=return_equity)
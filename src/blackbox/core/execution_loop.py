@@ -1,17 +1,18 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     executed: pd.Series
     fill_prices: pd.Series
     feedback: Dict[str, Dict]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DailyLog:
     date: pd.Timestamp
     prices: pd.Series
@@ -20,13 +21,172 @@ class DailyLog:
     feedback: Dict[str, Any]
 
 
+class DailyLogBuffer:
+    """
+    Column-oriented store for per-day backtest logs.
+
+    Prices, trades and portfolio weights are written into preallocated
+    (days x symbols) float arrays aligned on a fixed symbol universe, so a
+    logged day costs one row write instead of a Series copy. NaN marks a
+    symbol with no value that day. Series are rebuilt only when the history
+    is read, and the resulting DataFrame is cached until the next append.
+    Trades and weights may be stored as float32 (weight_dtype) to halve their
+    footprint; prices always stay float64.
+    """
+
+    def __init__(self, symbols: pd.Index, capacity: int = 0, weight_dtype: Any = np.float64):
+        # NaN is the absence marker, so only float storage can represent it
+        if not np.issubdtype(np.dtype(weight_dtype), np.floating):
+            raise ValueError(f"weight_dtype must be a float dtype, got {np.dtype(weight_dtype)}")
+        self.symbols = symbols
+        self.dates: list[pd.Timestamp] = []
+        self.feedback: list[Dict[str, Any]] = []
+        self._prices = np.full((capacity, len(symbols)), np.nan)
+        self._trades = np.full((capacity, len(symbols)), np.nan, dtype=weight_dtype)
+        self._portfolio = np.full((capacity, len(symbols)), np.nan, dtype=weight_dtype)
+        self._frame: pd.DataFrame | None = None
+        self._panels: Dict[str, pd.DataFrame] | None = None
+
+    def append(
+        self,
+        date: pd.Timestamp,
+        prices: pd.Series | np.ndarray,
+        trades: pd.Series,
+        portfolio: pd.Series,
+        feedback: Dict[str, Any],
+    ) -> None:
+        # Resolve every column position before touching the arrays, so a rejected
+        # day leaves the buffer unchanged
+        price_pos = self._positions(prices)
+        trade_pos = self._positions(trades)
+        portfolio_pos = self._positions(portfolio)
+
+        i = len(self.dates)
+        if i == len(self._prices):
+            self._grow()
+
+        self._write_row(self._prices[i], prices, price_pos)
+        self._write_row(self._trades[i], trades, trade_pos)
+        self._write_row(self._portfolio[i], portfolio, portfolio_pos)
+        self.dates.append(date)
+        self.feedback.append(feedback)
+        self._frame = None
+        self._panels = None
+
+    def _positions(self, series: pd.Series | np.ndarray) -> np.ndarray | None:
+        """Column positions of `series` in the universe; None if already aligned."""
+        if isinstance(series, np.ndarray):
+            return None
+        positions = self.symbols.get_indexer(series.index)
+        unknown = positions < 0
+        if unknown.any():
+            # get_indexer marks them -1, which would silently write the last column
+            raise ValueError(
+                f"Symbols outside the log universe: {series.index[unknown].tolist()[:10]}"
+            )
+        return positions
+
+    @staticmethod
+    def _write_row(
+        row: np.ndarray, series: pd.Series | np.ndarray, positions: np.ndarray | None
+    ) -> None:
+        if isinstance(series, np.ndarray):  # already aligned on self.symbols
+            row[:] = series
+        else:
+            row[positions] = series.to_numpy(dtype=float)
+
+    def _grow(self) -> None:
+        extra = max(len(self._prices), 1)
+        pad = np.full((extra, len(self.symbols)), np.nan)
+        self._prices = np.vstack([self._prices, pad])
+        self._trades = np.vstack([self._trades, pad.astype(self._trades.dtype)])
+        self._portfolio = np.vstack([self._portfolio, pad.astype(self._portfolio.dtype)])
+
+    def _row_series(self, values: np.ndarray, i: int) -> pd.Series:
+        row = values[i]
+        present = ~np.isnan(row)
+        return pd.Series(row[present], index=self.symbols[present])
+
+    def _rows(self, values: np.ndarray, n: int) -> list[pd.Series]:
+        # One vectorized NaN scan for the whole block, then gather row by row
+        block = values[:n]
+        present = ~np.isnan(block)
+        return [pd.Series(block[i, present[i]], index=self.symbols[present[i]]) for i in range(n)]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __iter__(self) -> Iterator[DailyLog]:
+        for i, date in enumerate(self.dates):
+            yield DailyLog(
+                date=date,
+                prices=self._row_series(self._prices, i),
+                trades=self._row_series(self._trades, i),
+                portfolio=self._row_series(self._portfolio, i),
+                feedback=self.feedback[i],
+            )
+
+    def to_frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            n = len(self.dates)
+            self._frame = pd.DataFrame(
+                {
+                    "prices": self._rows(self._prices, n),
+                    "trades": self._rows(self._trades, n),
+                    "portfolio": self._rows(self._portfolio, n),
+                    "feedback": self.feedback,
+                },
+                index=pd.Index(self.dates, name="date"),
+            )
+        return self._frame
+
+    def to_panels(self) -> Dict[str, pd.DataFrame]:
+        """
+        Return prices, trades and portfolio weights as (date x symbol) frames,
+        NaN where a symbol has no value. Skips the per-row Series of to_frame().
+        Cached until the next append, like to_frame().
+        """
+        if self._panels is None:
+            n = len(self.dates)
+            index = pd.Index(self.dates, name="date")
+            self._panels = {
+                "prices": pd.DataFrame(self._prices[:n], index=index, columns=self.symbols),
+                "trades": pd.DataFrame(self._trades[:n], index=index, columns=self.symbols),
+                "portfolio": pd.DataFrame(
+                    self._portfolio[:n], index=index, columns=self.symbols
+                ),
+            }
+        return self._panels
+
+
 def reconcile_trades(current: pd.Series, target: pd.Series) -> pd.Series:
     """Compute the required trade weights to move from current to target."""
-    all_symbols = current.index.union(target.index)
-    delta = target.reindex(all_symbols, fill_value=0.0) - current.reindex(
-        all_symbols, fill_value=0.0
-    )
-    return delta[delta.abs() > 1e-6]
+    # Flat book, full exit, or unchanged symbol set: both sides are already aligned
+    if current.empty:
+        all_symbols = target.index
+        delta = target.to_numpy(dtype=float, copy=True)
+    elif target.empty:
+        all_symbols = current.index
+        delta = -current.to_numpy(dtype=float)
+    elif current.index.equals(target.index):
+        all_symbols = target.index
+        delta = target.to_numpy(dtype=float) - current.to_numpy(dtype=float)
+    else:
+        all_symbols = current.index.union(target.index)
+        if not all_symbols.is_unique:
+            # Duplicate labels have no single position to scatter to; align by label
+            aligned = target.reindex(all_symbols, fill_value=0.0) - current.reindex(
+                all_symbols, fill_value=0.0
+            )
+            return aligned[aligned.abs() > 1e-6]
+
+        # Scatter both sides into one array aligned on the union, then diff in place
+        delta = np.zeros(len(all_symbols), dtype=float)
+        delta[all_symbols.get_indexer(target.index)] = target.to_numpy(dtype=float)
+        delta[all_symbols.get_indexer(current.index)] -= current.to_numpy(dtype=float)
+
+    mask = np.abs(delta) > 1e-6
+    return pd.Series(delta[mask], index=all_symbols[mask])
 
 
 def simulate_execution(
@@ -35,25 +195,33 @@ def simulate_execution(
     """Simulate slippage-adjusted execution of trades with cost feedback."""
     valid_trades = trades[trades.index.isin(prices.index)]
     executed = valid_trades.copy()
-    fill_prices = pd.Series(index=executed.index, dtype=float)
-    feedback = {}
-
-    for symbol, weight in executed.items():
-        raw_price = prices[symbol]
-        direction = 1 if weight > 0 else -1
-        slip_pct = slippage
-        fill_price = raw_price * (1 + slip_pct * direction)
+    symbols = executed.index
 
-        notional = weight * capital
-        trade_cost = abs(notional * slip_pct)
+    # Fill price, notional and cost for every trade in one pass over aligned arrays
+    weights = executed.to_numpy(dtype=float)
+    raw_prices = prices.to_numpy(dtype=float)[prices.index.get_indexer(symbols)]
+    direction = np.where(weights > 0, 1, -1)
+    fill = raw_prices * (1 + slippage * direction)
+    notional = weights * capital
+    trade_cost = np.abs(notional * slippage)
 
-        fill_prices[symbol] = fill_price
-        feedback[symbol] = {
+    fill_prices = pd.Series(fill, index=symbols, dtype=float)
+    feedback = {
+        symbol: {
             "fill_price": fill_price,
-            "slippage": slip_pct,
-            "notional": notional,
-            "cost": trade_cost,
-            "direction": "buy" if direction > 0 else "sell",
+            "slippage": slippage,
+            "notional": notional_i,
+            "cost": cost_i,
+            "direction": "buy" if direction_i > 0 else "sell",
         }
+        for symbol, fill_price, notional_i, cost_i, direction_i in zip(
+            symbols,
+            fill.tolist(),
+            notional.tolist(),
+            trade_cost.tolist(),
+            direction.tolist(),
+            strict=True,
+        )
+    }
 
     return TradeResult(executed=executed, fill_prices=fill_prices, feedback=feedback)
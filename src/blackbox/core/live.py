@@ -61,8 +61,9 @@ class LiveTradingEngine:
             self.history.append(
                 {
                     "date": date,
-                    "portfolio": self.portfolio_state.copy(),
-                    "trades": executed.copy(),
+                    # Both are replaced, not mutated, on the next tick
+                    "portfolio": self.portfolio_state,
+                    "trades": executed,
                     "prices": prices.copy(),
                 }
             )
@@ -37,19 +37,20 @@ class FeatureMatrixGenerator:
         self.logger.info(f"🔄 Running feature pipeline over {len(ohlcv)} rows...")
         full_features = self.pipeline.run(ohlcv)
 
-        earliest_feature_date = full_features.index.get_level_values("date").min()
-        latest_feature_date = full_features.index.get_level_values("date").max()
+        feature_dates = full_features.index.get_level_values("date")
+        earliest_feature_date = feature_dates.min()
+        latest_feature_date = feature_dates.max()
         self.logger.info(
             f"📐 Full feature frame range: {earliest_feature_date} → {latest_feature_date}"
         )
 
         # Log the earliest date for each feature to show warmup requirements
         first_dates = {}
-        for column in full_features.columns:
+        valid = full_features.notna().to_numpy()
+        for j, column in enumerate(full_features.columns):
             # Find first non-NaN date for this feature
-            valid_data = full_features[column].dropna()
-            if not valid_data.empty:
-                first_dates[column] = valid_data.index.get_level_values("date").min()
+            if valid[:, j].any():
+                first_dates[column] = feature_dates[valid[:, j]].min()
 
         if first_dates:
             self.logger.info(f"🏁 Feature earliest valid dates: {first_dates}")
@@ -61,6 +62,13 @@ class FeatureMatrixGenerator:
             raise ValueError("❌ Feature output missing 'date' level in index")
 
         full_features = full_features[~full_features.index.duplicated(keep="first")]
+        # Sorted by date, each day's rows are one contiguous block; locate every
+        # block with a binary search instead of masking the whole index per day
+        if not full_features.index.is_monotonic_increasing:
+            full_features = full_features.sort_index()
+        feature_dates = full_features.index.get_level_values("date")
+        day_starts = feature_dates.searchsorted(dates, side="left")
+        day_ends = feature_dates.searchsorted(dates, side="right")
         total_symbols = ohlcv.index.get_level_values("symbol").nunique()
 
         earliest_requested_date = min(dates) if dates else None
@@ -87,7 +95,7 @@ class FeatureMatrixGenerator:
         ) as progress:
             task = progress.add_task("slice", total=len(dates))
 
-            for date in dates:
+            for date, start, end in zip(dates, day_starts, day_ends, strict=True):
                 progress.advance(task)
 
                 if start_date and date < start_date:
@@ -102,8 +110,7 @@ class FeatureMatrixGenerator:
                     )
                     continue
 
-                mask = full_features.index.get_level_values("date") == date
-                daily_features = full_features.loc[mask]
+                daily_features = full_features.iloc[start:end]
 
                 if daily_features.empty:
                     missing_dates += 1
@@ -112,9 +119,8 @@ class FeatureMatrixGenerator:
                     )
                     continue
 
-                valid_symbols = daily_features.index.get_level_values(
-                    "symbol"
-                ).nunique()
+                # (date, symbol) rows are deduplicated, so the block length is the count
+                valid_symbols = end - start
                 self.logger.debug(
                     f"{date.date()} | ✅ Valid symbols: {valid_symbols} / {total_symbols}"
                 )
@@ -142,10 +148,10 @@ class FeatureMatrixGenerator:
             raise RuntimeError(msg)
 
         result = pd.concat(feature_frames).sort_index()
-        result.index = pd.MultiIndex.from_tuples(
+        result.index = pd.MultiIndex.from_arrays(
             [
-                (pd.to_datetime(date).normalize(), symbol)
-                for date, symbol in result.index
+                pd.to_datetime(result.index.get_level_values(0)).normalize(),
+                result.index.get_level_values(1),
             ],
             names=["date", "symbol"],
         )
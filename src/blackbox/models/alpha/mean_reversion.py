@@ -21,6 +21,23 @@ class MeanReversionAlphaModel(FeatureAwareAlphaModel):
         """Alias for generate to support standard ML interface"""
         return self.generate(snapshot)
 
+    def generate_batch(self, feature_matrix: pd.DataFrame) -> pd.Series:
+        """
+        Vectorized generate() over a full [date, symbol] feature matrix.
+        Returns thresholded signals indexed by [date, symbol]; the caller is
+        responsible for restricting each date to symbols with prices.
+        """
+        zscore_columns = [col for col in feature_matrix.columns if "zscore" in col]
+        if not zscore_columns:
+            return pd.Series(dtype=float, index=feature_matrix.index[:0])
+
+        # generate() skips dates where every feature value is zero
+        active = (feature_matrix != 0).any(axis=1).groupby(level="date").transform("any")
+
+        feature_subset = feature_matrix.loc[active, zscore_columns].dropna(how="all")
+        signals = -feature_subset.mean(axis=1)
+        return signals[signals.abs() > self.threshold]
+
     def generate(self, snapshot: dict) -> pd.Series:
         logger = get_logger()
         logger.info(f"MeanReversionAlphaModel: Processing snapshot for {snapshot['date']}")
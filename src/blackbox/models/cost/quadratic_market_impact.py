@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from blackbox.models.interfaces import TransactionCostModel
@@ -33,20 +34,21 @@ class QuadraticImpact(TransactionCostModel):
             pd.Series: Adjusted target weights
         """
         delta = target.sub(current, fill_value=0.0)
-
-        adjusted = target.copy()
-
-        for symbol, weight_change in delta.items():
-            notional = abs(weight_change)
-
-            # Cost = linear + quadratic impact
-            commission = max(self.commission_rate * notional, self.min_commission)
-            impact = self.impact_coefficient * (notional**2)
-            total_cost = commission + impact
-
-            # Reduce the proposed size to reflect the cost penalty
-            adjusted[symbol] = adjusted.get(symbol, 0.0) - total_cost * (
-                1 if weight_change > 0 else -1
-            )
-
-        return adjusted
+        weight_change = delta.to_numpy(dtype=float)
+        notional = np.abs(weight_change)
+
+        # Cost = linear + quadratic impact
+        commission = np.maximum(self.commission_rate * notional, self.min_commission)
+        impact = self.impact_coefficient * (notional**2)
+        total_cost = commission + impact
+
+        # Reduce the proposed size to reflect the cost penalty; symbols only in
+        # `current` are appended (in delta order) starting from a weight of 0
+        exiting = delta.index[~delta.index.isin(target.index)]
+        adjusted = target.reindex(target.index.append(exiting), fill_value=0.0)
+        values = adjusted.to_numpy(dtype=float, copy=True)
+        values[adjusted.index.get_indexer(delta.index)] -= total_cost * np.where(
+            weight_change > 0, 1, -1
+        )
+
+        return pd.Series(values, index=adjusted.index, name=target.name)
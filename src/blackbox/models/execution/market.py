@@ -1,5 +1,7 @@
+import logging
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from blackbox.models.interfaces import ExecutionModel
@@ -33,7 +35,8 @@ class MarketExecution(ExecutionModel):
 
     def record(self, trades: pd.Series, feedback: Dict[str, Dict]):
         """Store the executed trades and execution feedback for future reference."""
-        self.history.append((trades.copy(), feedback.copy()))
+        # Both are built fresh for each day and never mutated afterwards
+        self.history.append((trades, feedback))
 
     def update_portfolio(self, current: pd.Series, trades: pd.Series) -> pd.Series:
         """
@@ -41,32 +44,41 @@ class MarketExecution(ExecutionModel):
         Updates internal state: positions and cash.
         Returns: updated positions (filtered to abs(weight) > 1e-6)
         """
-        new_weights = current.copy()
-
-        for symbol, weight_delta in trades.items():
-            if not self.fractional:
-                weight_delta = round(weight_delta, 4)
-
-            prev_weight = new_weights.get(symbol, 0.0)
-            new_weight = prev_weight + weight_delta
-            notional = abs(weight_delta * self.portfolio_value)
-
-            if not self.allow_shorts and new_weight < 0:
-                self.logger.debug(f"[Execution] Skipping short trade: {symbol}")
-                continue
-
-            if notional < self.min_notional:
-                self.logger.debug(
-                    f"[Execution] Skipping {symbol} — notional ${notional:.2f} < min ${self.min_notional:.2f}"
-                )
-                continue
-
-            new_weights[symbol] = new_weight
-            self.logger.debug(
-                f"[Execution] {symbol}: Δweight={weight_delta:.6f} → new_weight={new_weight:.6f}"
-            )
-
-        self.positions = new_weights.copy()
+        deltas = trades.to_numpy(dtype=float)
+        if not self.fractional:
+            deltas = np.round(deltas, 4)
+
+        prev_weights = current.reindex(trades.index, fill_value=0.0).to_numpy(dtype=float)
+        new_values = prev_weights + deltas
+        notional = np.abs(deltas * self.portfolio_value)
+
+        # Negated comparisons so NaN deltas pass through exactly as before
+        is_short = np.zeros(len(deltas), dtype=bool)
+        if not self.allow_shorts:
+            is_short = new_values < 0
+        too_small = ~is_short & (notional < self.min_notional)
+        accepted = ~(is_short | too_small)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i, symbol in enumerate(trades.index):
+                if is_short[i]:
+                    self.logger.debug(f"[Execution] Skipping short trade: {symbol}")
+                elif too_small[i]:
+                    self.logger.debug(
+                        f"[Execution] Skipping {symbol} — notional ${notional[i]:.2f} "
+                        f"< min ${self.min_notional:.2f}"
+                    )
+                else:
+                    self.logger.debug(
+                        f"[Execution] {symbol}: Δweight={deltas[i]:.6f} "
+                        f"→ new_weight={new_values[i]:.6f}"
+                    )
+
+        applied = trades.index[accepted]
+        new_weights = current.reindex(current.index.union(applied, sort=False))
+        new_weights.loc[applied] = new_values[accepted]
+
+        self.positions = new_weights
         self.current_cash = self.portfolio_value * (1.0 - new_weights.abs().sum())
 
         return self.positions[self.positions.abs() > 1e-6].sort_index()
@@ -75,28 +87,30 @@ class MarketExecution(ExecutionModel):
         """Returns the current total portfolio value (cash + positions)."""
         return self.portfolio_value
 
-    def mark_to_market(self, prices: pd.Series):
+    def mark_to_market(self, prices: pd.Series) -> float:
         """
-        Updates internal portfolio value using current prices.
+        Updates internal portfolio value using current prices and returns it.
         If a symbol is missing from prices, it's skipped with a warning.
         """
-        weighted_values = {
-            symbol: weight * prices[symbol]
-            for symbol, weight in self.positions.items()
-            if symbol in prices
-        }
+        priced = self.positions.index.isin(prices.index)
+        held = self.positions[priced]
+        position_value = float(
+            np.dot(held.to_numpy(dtype=float), prices.reindex(held.index).to_numpy(dtype=float))
+        )
 
-        missing = [s for s in self.positions.index if s not in prices]
-        for symbol in missing:
-            self.logger.warning(f"[MTM] Missing price for {symbol}, skipping.")
+        missing = self.positions.index[~priced].tolist()
+        if missing:
+            self.logger.warning(
+                f"[MTM] Missing price for {len(missing)} symbol(s), skipping: {', '.join(missing)}"
+            )
 
-        position_value = sum(weighted_values.values())
         self.portfolio_value = position_value + self.current_cash
 
         self.logger.debug(
             f"[MTM] Portfolio value updated: ${self.portfolio_value:,.2f} "
             f"(cash: ${self.current_cash:,.2f})"
         )
+        return self.portfolio_value
 
     def __repr__(self):
         return (
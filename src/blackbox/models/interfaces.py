@@ -66,6 +66,8 @@ class PortfolioConstructionModel(Protocol):
 @runtime_checkable
 class ExecutionModel(Protocol):
     name: str
+    portfolio_value: float
+    current_cash: float
 
     def record(self, trades: pd.Series, feedback: dict):
         """
@@ -1,3 +1,4 @@
+import logging
 from typing import Dict
 
 import pandas as pd
@@ -67,6 +68,21 @@ class VolatilityScaledPortfolio(PortfolioConstructionModel):
             self.logger.warning(f"Error in normalization: {e}. Using original signals.")
             return alpha
 
+    def _volatilities(self, close: pd.Series, symbols: pd.Index) -> pd.Series:
+        """
+        Per-symbol return volatility over the last vol_lookback + 1 closes,
+        floored at min_volatility (also used when it can't be estimated).
+        """
+        close = close[close.index.get_level_values(1).isin(symbols)]
+        if not close.index.is_monotonic_increasing:
+            close = close.sort_index()
+
+        recent = close.groupby(level=1, sort=False).tail(self.vol_lookback + 1)
+        returns = recent / recent.groupby(level=1, sort=False).shift(1) - 1
+        vols = returns.groupby(level=1).std().reindex(symbols)
+
+        return vols.where(vols > 0).clip(lower=self.min_volatility).fillna(self.min_volatility)
+
     def construct(self, alpha: pd.Series, snapshot: Dict) -> pd.Series:
         ohlcv: pd.DataFrame = snapshot.get("ohlcv")
         capital: float = snapshot.get("capital", 1_000_000.0)
@@ -128,55 +144,32 @@ class VolatilityScaledPortfolio(PortfolioConstructionModel):
         self.logger.debug(f"OHLCV index names: {ohlcv.index.names}")
         self.logger.debug(f"OHLCV sample shapes: rows={len(ohlcv)}, columns={len(ohlcv.columns)}")
 
-        # Check actual alpha symbols against OHLCV symbols
-        ohlcv_symbols = set()
-        if isinstance(ohlcv.index, pd.MultiIndex):
-            ohlcv_symbols = set(ohlcv.index.get_level_values(1))
-        else:
-            ohlcv_symbols = set(ohlcv.index)
-
-        alpha_symbols = set(alpha.index)
-        common_symbols = alpha_symbols.intersection(ohlcv_symbols)
-        self.logger.debug(
-            f"Symbol overlap: {len(common_symbols)}/{len(alpha_symbols)} alpha symbols found in OHLCV data"
-        )
+        # Check actual alpha symbols against OHLCV symbols; only the debug line
+        # uses this, and the OHLCV window has one row per (day, symbol)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            if isinstance(ohlcv.index, pd.MultiIndex):
+                ohlcv_symbols = ohlcv.index.unique(level=1)
+            else:
+                ohlcv_symbols = ohlcv.index.unique()
+            alpha_symbols = alpha.index.unique()
+            common_symbols = alpha_symbols.isin(ohlcv_symbols).sum()
+            self.logger.debug(
+                f"Symbol overlap: {common_symbols}/{len(alpha_symbols)} "
+                "alpha symbols found in OHLCV data"
+            )
 
         # Calculate volatilities for each symbol - FIX for the index issue
         try:
             # Extract current date's price data
             prices_today = snapshot.get("prices")
 
-            # Manually calculate volatilities for exactly the symbols in alpha
-            vols = {}
-
-            for symbol in alpha.index:
-                try:
-                    # Extract price history for this symbol
-                    if isinstance(ohlcv.index, pd.MultiIndex):
-                        symbol_data = ohlcv.xs(symbol, level=1, drop_level=False)
-
-                        # Get the most recent sequence of data
-                        if len(symbol_data) > self.vol_lookback:
-                            symbol_data = symbol_data.sort_index().tail(self.vol_lookback + 1)
-
-                        # Calculate returns and volatility
-                        returns = symbol_data["close"].pct_change().dropna()
-                        vol = returns.std()
-
-                        if pd.notna(vol) and vol > 0:
-                            vols[symbol] = max(vol, self.min_volatility)
-                        else:
-                            vols[symbol] = self.min_volatility
-
-                    else:
-                        # If OHLCV is not MultiIndex, use a fallback approach
-                        vols[symbol] = self.min_volatility
-
-                except Exception as e:
-                    self.logger.debug(f"Error calculating volatility for {symbol}: {e}")
-                    vols[symbol] = self.min_volatility
+            # Volatilities for exactly the symbols in alpha, in one grouped pass
+            if isinstance(ohlcv.index, pd.MultiIndex):
+                vol_series = self._volatilities(ohlcv["close"], alpha.index)
+            else:
+                # If OHLCV is not MultiIndex, use a fallback approach
+                vol_series = pd.Series(self.min_volatility, index=alpha.index)
 
-            vol_series = pd.Series(vols)
             self.logger.debug(
                 f"Manual volatility calculation: {len(vol_series)} symbols, range: {vol_series.min():.6f} to {vol_series.max():.6f}"
             )
@@ -292,7 +285,8 @@ class VolatilityScaledPortfolio(PortfolioConstructionModel):
             self.logger.debug(f"Applied scaling factor: {scale_factor:.4f}")
 
         self.invested_weights = weights.to_dict()
-        self.logger.debug(f"Final weights: {weights.to_dict()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Final weights: {weights.to_dict()}")
         self.logger.info(
             f"✅ Constructed {len(weights)} positions | Gross exposure: {weights.abs().sum():.4f}"
         )
@@ -301,9 +295,10 @@ class VolatilityScaledPortfolio(PortfolioConstructionModel):
     def feedback_from_execution(self, feedback: dict):
         pass  # Not implemented yet
 
-    def mark_to_market(self, prices: pd.Series):
+    def mark_to_market(self, prices: pd.Series) -> float:
         portfolio_val = 0.0
         for symbol, weight in self.invested_weights.items():
             if symbol in prices:
                 portfolio_val += weight * prices[symbol]
         self.portfolio_value = portfolio_val
+        return portfolio_val
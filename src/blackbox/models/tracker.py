@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 from math import isclose
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionMeta:
     entry_date: pd.Timestamp
     weight: float
@@ -20,19 +21,24 @@ class PositionTracker:
 
     def __init__(self):
         self.positions: Dict[str, PositionMeta] = {}
+        self._portfolio: Optional[pd.Series] = None  # get_portfolio() result until next update
 
     def get_portfolio(self) -> pd.Series:
         """
         Returns current portfolio as a Series of weights,
         filtered to exclude near-zero positions.
+        Built once per update(); each call returns a copy of the cached Series,
+        so callers may mutate it without corrupting the tracker.
         """
-        return pd.Series(
-            {
-                symbol: meta.weight
-                for symbol, meta in self.positions.items()
-                if not isclose(meta.weight, 0.0, abs_tol=1e-6)
-            }
-        ).sort_index()
+        if self._portfolio is None:
+            self._portfolio = pd.Series(
+                {
+                    symbol: meta.weight
+                    for symbol, meta in self.positions.items()
+                    if not isclose(meta.weight, 0.0, abs_tol=1e-6)
+                }
+            ).sort_index()
+        return self._portfolio.copy()
 
     def can_trade(
         self, symbol: str, current_date: pd.Timestamp, min_holding: int
@@ -55,12 +61,21 @@ class PositionTracker:
         - Long positions (weight ≥ 0) are always allowed
         - Short positions (weight < 0) require min holding period
         """
-        filtered = {
-            symbol: weight
-            for symbol, weight in trades.items()
-            if weight >= 0 or self.can_trade(symbol, date, min_holding)
-        }
-        return pd.Series(filtered).sort_index()
+        allowed = trades.to_numpy(dtype=float) >= 0
+
+        # Only shorts need the holding-period check; symbols not held have no entry date
+        shorts = np.flatnonzero(~allowed)
+        if shorts.size:
+            entry_dates = pd.DatetimeIndex(
+                [
+                    meta.entry_date if (meta := self.positions.get(symbol)) else pd.NaT
+                    for symbol in trades.index[shorts]
+                ]
+            )
+            days_held = (date - entry_dates).days
+            allowed[shorts] = entry_dates.isna() | (days_held >= min_holding)
+
+        return trades[allowed].sort_index()
 
     def update(self, updated_portfolio: pd.Series, date: pd.Timestamp):
         """
@@ -69,19 +84,19 @@ class PositionTracker:
         - Updates weights for existing ones
         - Removes any positions with weight ≈ 0
         """
+        self._portfolio = None
+
         # Update or create positions
-        for symbol, weight in updated_portfolio.items():
+        for symbol, weight in zip(updated_portfolio.index, updated_portfolio.tolist(), strict=True):
             existing = self.positions.get(symbol)
             if existing is None or isclose(existing.weight, 0.0, abs_tol=1e-6):
                 self.positions[symbol] = PositionMeta(entry_date=date, weight=weight)
             else:
                 existing.weight = weight
 
-        # Remove exited positions
-        to_remove = [
-            symbol
-            for symbol, meta in self.positions.items()
-            if isclose(updated_portfolio.get(symbol, 0.0), 0.0, abs_tol=1e-6)
-        ]
+        # Remove exited positions: held symbols whose new weight is missing or ≈ 0
+        held = pd.Index(list(self.positions))
+        new_weights = updated_portfolio.reindex(held, fill_value=0.0).to_numpy(dtype=float)
+        to_remove = held[np.abs(new_weights) <= 1e-6]
         for symbol in to_remove:
             del self.positions[symbol]
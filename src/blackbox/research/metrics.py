@@ -23,6 +23,21 @@ class PerformanceMetrics:
         - metrics dict (and optionally equity curve)
         """
         equity = self._compute_equity_curve(history)
+        return self._summarize(equity, return_equity)
+
+    def compute_from_panels(
+        self, prices: pd.DataFrame, weights: pd.DataFrame, return_equity: bool = False
+    ) -> Union[Dict[str, float | str], tuple[Dict[str, float | str], pd.Series]]:
+        """
+        Compute the same metrics as compute() from (date x symbol) price and
+        weight frames, e.g. DailyLogBuffer.to_panels(). NaN marks no value.
+        """
+        equity = self._equity_from_panels(prices, weights)
+        return self._summarize(equity, return_equity)
+
+    def _summarize(
+        self, equity: pd.Series, return_equity: bool
+    ) -> Union[Dict[str, float | str], tuple[Dict[str, float | str], pd.Series]]:
         returns = equity.pct_change().fillna(0)
 
         total_return = equity.iloc[-1] / equity.iloc[0] - 1
@@ -67,28 +82,28 @@ class PerformanceMetrics:
         - 'portfolio': pd.Series of weights
         - 'prices': pd.Series of prices (same index as weights)
         """
-        price_df = pd.DataFrame([row["prices"] for _, row in history.iterrows()])
-        price_df.index = history.index
-        daily_returns = price_df.pct_change(fill_method=None).fillna(0)
-
-        nav_returns = []
-        for i, (date, row) in enumerate(history.iterrows()):
-            weights = row["portfolio"]
-            if i == 0:
-                nav_returns.append(0.0)  # no return on first day
-                continue
-            ret = (weights * daily_returns.loc[date]).sum()
-            nav_returns.append(ret)
-
-        equity_curve = pd.Series(nav_returns, index=history.index).add(1).cumprod()
+        price_df = pd.DataFrame(list(history["prices"]), index=history.index)
+        weight_df = pd.DataFrame(list(history["portfolio"]), index=history.index)
+        return self._equity_from_panels(price_df, weight_df)
+
+    def _equity_from_panels(self, prices: pd.DataFrame, weights: pd.DataFrame) -> pd.Series:
+        daily_returns = prices.pct_change(fill_method=None).fillna(0)
+
+        # Each day's return is that day's weights times that day's price moves
+        nav_returns = (weights * daily_returns).sum(axis=1)
+        nav_returns.iloc[:1] = 0.0  # no return on first day
+
+        equity_curve = nav_returns.add(1).cumprod()
         equity_curve *= self.initial_value
         equity_curve.name = "NetAssetValue"
         return equity_curve
 
     def _max_drawdown(self, series: pd.Series) -> float:
-        peak = series.expanding(min_periods=1).max()
-        drawdown = (series - peak) / peak
-        return drawdown.min()
+        # fmax/nanmin skip NaNs the way expanding().max() and Series.min() do
+        values = series.to_numpy(dtype=float)
+        peak = np.fmax.accumulate(values)
+        drawdown = (values - peak) / peak
+        return np.nanmin(drawdown)
 
     def _sortino_ratio(self, returns: pd.Series) -> float:
         downside_returns = returns[returns < 0]
@@ -10,10 +10,25 @@ from blackbox.utils.logger import RichLogger
 
 _context: dict[str, Any] = {}
 
+# Mirror of _context["logger"], kept in sync so get_logger() skips the dict lookup
+_logger: RichLogger | None = None
+
+
+def _sync_logger() -> None:
+    global _logger
+    logger = _context.get("logger")
+    _logger = logger if isinstance(logger, RichLogger) else None
+
 
 def set_value(key: str, value: Any):
     """Register a shared dependency globally."""
     _context[key] = value
+    if key == "logger":
+        _sync_logger()
+
+
+def set_logger(logger: RichLogger) -> None:
+    set_value("logger", logger)
 
 
 def get(key: str, default: Any = None) -> Any:
@@ -26,6 +41,7 @@ def has(key: str) -> bool:
 
 def clear():
     _context.clear()
+    _sync_logger()
 
 
 def validate(required: list[str]):
@@ -35,10 +51,9 @@ def validate(required: list[str]):
 
 
 def get_logger() -> RichLogger:
-    logger = get("logger")
-    if not isinstance(logger, RichLogger):
+    if _logger is None:
         raise RuntimeError("Logger is not set or is of the wrong type.")
-    return logger
+    return _logger
 
 
 @contextmanager
@@ -46,10 +61,12 @@ def scoped_context(overrides: dict[str, Any]):
     original = deepcopy(_context)
     try:
         _context.update(overrides)
+        _sync_logger()
         yield
     finally:
         _context.clear()
         _context.update(original)
+        _sync_logger()
 
 
 _feature_matrix = None
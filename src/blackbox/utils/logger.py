@@ -66,6 +66,18 @@ class RichLogger:
             file_handler.setFormatter(formatter)
             self._logger.addHandler(file_handler)
 
+    # Pickling (e.g. engines/models sent to worker processes): the console holds locks
+    # and stream handles, so rebuild it; the stdlib logger pickles by name and resolves
+    # to the receiving process's logger
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["console"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.console = Console()
+
     # Drop-in replacements with args/kwargs
     def debug(self, msg: str, *args, **kwargs):
         self._logger.debug(msg, *args, **kwargs)
@@ -82,5 +94,8 @@ class RichLogger:
     def exception(self, msg: str, *args, **kwargs):
         self._logger.exception(msg, *args, **kwargs)
 
+    def isEnabledFor(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
     def get_logger(self) -> logging.Logger:
         return self._logger
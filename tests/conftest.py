@@ -0,0 +1,13 @@
+import pytest
+
+from blackbox.utils import context
+from blackbox.utils.logger import RichLogger
+
+
+@pytest.fixture(autouse=True)
+def logger():
+    """Register a quiet logger in the shared context for models that look it up."""
+    logger = RichLogger(level="WARNING", log_to_console=False, log_to_file=False)
+    context.set_logger(logger)
+    yield logger
+    context.clear()
@@ -0,0 +1,88 @@
+import copy
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackbox.config.loader import load_config
+from blackbox.core.backtest import BacktestEngine
+from blackbox.feature_generators.matrix import FeatureMatrixGenerator
+
+BASE_CONFIG = Path(__file__).parents[1] / "config" / "strategies" / "debug_test.yaml"
+
+
+@pytest.fixture
+def config():
+    config = load_config(BASE_CONFIG)
+    config.log_level = "WARNING"
+    config.log_to_console = False
+    config.log_to_file = False
+    config.plot_equity = False
+    return config
+
+
+@pytest.fixture
+def market(config):
+    """Synthetic daily OHLCV snapshots and their feature matrix."""
+    rng = np.random.default_rng(0)
+    symbols = [f"S{i:02d}" for i in range(8)]
+    dates = pd.bdate_range("2022-01-03", periods=30)
+    close = 100 * np.cumprod(1 + 0.02 * rng.standard_normal((len(dates), len(symbols))), axis=0)
+
+    index = pd.MultiIndex.from_product([dates, symbols], names=["date", "symbol"])
+    flat = close.ravel()
+    ohlcv = pd.DataFrame(
+        {
+            "open": flat,
+            "high": flat * 1.01,
+            "low": flat * 0.99,
+            "close": flat,
+            "volume": 1e6,
+        },
+        index=index,
+    )
+    features = FeatureMatrixGenerator(config.alpha_model.get_feature_spec()).run(
+        ohlcv, list(dates)
+    )
+    data = [
+        {
+            "date": date,
+            "prices": ohlcv.xs(date, level="date")["close"],
+            "ohlcv": ohlcv.loc[dates[max(0, i - 10)] : date],
+        }
+        for i, date in enumerate(dates)
+    ]
+    return data, features
+
+
+def test_run_sweep_metrics_do_not_depend_on_worker_count(config, market, tmp_path):
+    data, features = market
+
+    def grid(n_workers: int) -> list:
+        configs = []
+        for threshold in (0.1, 1.2):
+            run = copy.deepcopy(config)
+            run.alpha_model.params["threshold"] = threshold
+            # Engines dump their config under results/<run_id>; an absolute run_id
+            # keeps that inside tmp_path (models are discovered relative to the repo root)
+            run.run_id = str(tmp_path / f"grid_{n_workers}")
+            run.n_workers = n_workers
+            configs.append(run)
+        return configs
+
+    serial_grid = grid(1)
+    serial = BacktestEngine.run_sweep(serial_grid, data, features)
+    parallel = BacktestEngine.run_sweep(grid(2), data, features)
+
+    assert len(serial) == 2
+    assert all(metrics for metrics in serial)
+    # Distinct results, so an order mix-up between workers would show
+    assert serial[0] != serial[1]
+    assert serial == parallel
+
+    # Grid members share a run_id but each dumps its own config
+    assert [run.run_id for run in serial_grid] == [str(tmp_path / "grid_1")] * 2
+    for i, threshold in enumerate((0.1, 1.2)):
+        (dump,) = (tmp_path / f"grid_1_{i}").glob("*/config.yaml")
+        assert load_config(dump).alpha_model.params["threshold"] == threshold
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from blackbox.config.loader import load_config
+
+BASE_CONFIG = Path(__file__).parents[1] / "config" / "strategies" / "debug_test.yaml"
+
+
+def _write_config(tmp_path: Path, **overrides) -> Path:
+    raw = yaml.safe_load(BASE_CONFIG.read_text())
+    raw.update(overrides)
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(raw))
+    return path
+
+
+def test_load_config_accepts_int_for_float_field(tmp_path):
+    config = load_config(_write_config(tmp_path, initial_portfolio_value=5000, n_workers=2))
+    assert config.initial_portfolio_value == 5000
+    assert config.n_workers == 2
+
+
+def test_load_config_accepts_float32_weights(tmp_path):
+    assert load_config(_write_config(tmp_path, weight_dtype="float32")).weight_dtype == "float32"
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("initial_portfolio_value", "1e6"),
+        ("n_workers", "4"),
+        ("n_workers", True),
+        ("plot_equity", "yes"),
+        ("weight_dtype", "int64"),
+        ("weight_dtype", 32),
+    ],
+)
+def test_load_config_rejects_mistyped_field(tmp_path, field, value):
+    with pytest.raises(ValueError, match=field):
+        load_config(_write_config(tmp_path, **{field: value}))
+
+
+def test_load_config_rejects_mistyped_nested_field(tmp_path):
+    raw = yaml.safe_load(BASE_CONFIG.read_text())
+    with pytest.raises(ValueError, match="DataConfig.window"):
+        load_config(_write_config(tmp_path, data={**raw["data"], "window": "20"}))
+
+
+def test_load_config_follows_retargeted_symlink(tmp_path):
+    first = _write_config(tmp_path, run_id="first")
+    second = first.with_name("second.yaml")
+    raw = yaml.safe_load(first.read_text())
+    second.write_text(yaml.safe_dump({**raw, "run_id": "second"}))
+    link = tmp_path / "active.yaml"
+
+    link.symlink_to(first)
+    assert load_config(link).run_id == "first"
+
+    link.unlink()
+    link.symlink_to(second)
+    assert load_config(link).run_id == "second"
+
+
+def test_load_config_returns_private_copies(tmp_path):
+    path = _write_config(tmp_path)
+    load_config(path).alpha_model.params["threshold"] = 99.0
+
+    assert load_config(path).alpha_model.params["threshold"] != 99.0
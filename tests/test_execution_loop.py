@@ -0,0 +1,249 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackbox.core.execution_loop import (
+    DailyLog,
+    DailyLogBuffer,
+    reconcile_trades,
+    simulate_execution,
+)
+
+UNIVERSE = pd.Index(["AAA", "BBB", "CCC", "DDD"], name="symbol")
+
+
+def _daily_logs(n_days: int = 5) -> list[DailyLog]:
+    """Per-day records as the engine kept them before the buffer: ragged Series."""
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range("2024-01-01", periods=n_days)
+    logs = []
+    for i, date in enumerate(dates):
+        held = UNIVERSE[rng.permutation(len(UNIVERSE))[: 1 + i % len(UNIVERSE)]]
+        logs.append(
+            DailyLog(
+                date=date,
+                prices=pd.Series(100 + rng.normal(size=len(UNIVERSE)), index=UNIVERSE[::-1]),
+                trades=pd.Series(rng.normal(size=len(held[:2])), index=held[:2]),
+                portfolio=pd.Series(rng.normal(size=len(held)), index=held),
+                feedback={"day": i},
+            )
+        )
+    return logs
+
+
+def _fill(buffer: DailyLogBuffer, logs: list[DailyLog]) -> DailyLogBuffer:
+    for log in logs:
+        buffer.append(log.date, log.prices, log.trades, log.portfolio, log.feedback)
+    return buffer
+
+
+def _in_universe_order(series: pd.Series) -> pd.Series:
+    return series.reindex(UNIVERSE[UNIVERSE.isin(series.index)])
+
+
+def test_append_round_trips_each_day():
+    logs = _daily_logs()
+    buffer = _fill(DailyLogBuffer(UNIVERSE, capacity=len(logs)), logs)
+
+    assert len(buffer) == len(logs)
+    for got, expected in zip(buffer, logs, strict=True):
+        assert got.date == expected.date
+        assert got.feedback == expected.feedback
+        for field in ("prices", "trades", "portfolio"):
+            pd.testing.assert_series_equal(
+                getattr(got, field),
+                _in_universe_order(getattr(expected, field)),
+                check_names=False,
+                check_index_type=False,
+            )
+
+
+def test_append_grows_past_initial_capacity():
+    logs = _daily_logs(n_days=7)
+    buffer = _fill(DailyLogBuffer(UNIVERSE, capacity=1), logs)
+
+    assert len(buffer) == 7
+    assert buffer.to_panels()["portfolio"].shape == (7, len(UNIVERSE))
+    assert [log.feedback["day"] for log in buffer] == list(range(7))
+
+
+def test_nan_marks_absent_symbols():
+    date = pd.Timestamp("2024-01-01")
+    buffer = DailyLogBuffer(UNIVERSE)
+    buffer.append(
+        date,
+        prices=np.array([1.0, np.nan, 3.0, 4.0]),
+        trades=pd.Series(dtype=float),
+        portfolio=pd.Series({"CCC": 0.5, "AAA": 0.0}),
+        feedback={},
+    )
+
+    log = next(iter(buffer))
+    assert log.prices.index.tolist() == ["AAA", "CCC", "DDD"]
+    assert log.trades.empty
+    # A zero weight is a held position, not an absent one
+    assert log.portfolio.to_dict() == {"AAA": 0.0, "CCC": 0.5}
+    assert np.isnan(buffer.to_panels()["portfolio"].loc[date, "BBB"])
+
+
+def test_to_frame_matches_list_of_daily_logs():
+    logs = _daily_logs()
+    frame = _fill(DailyLogBuffer(UNIVERSE), logs).to_frame()
+    reference = pd.DataFrame([{f: getattr(log, f) for f in DailyLog.__slots__} for log in logs])
+    reference = reference.set_index("date")
+
+    assert frame.index.equals(reference.index)
+    assert frame.columns.tolist() == reference.columns.tolist()
+    assert frame["feedback"].tolist() == reference["feedback"].tolist()
+    for column in ("prices", "trades", "portfolio"):
+        for got, expected in zip(frame[column], reference[column], strict=True):
+            assert got.equals(_in_universe_order(expected))
+
+
+def test_to_panels_matches_list_of_daily_logs():
+    logs = _daily_logs()
+    panels = _fill(DailyLogBuffer(UNIVERSE), logs).to_panels()
+    dates = pd.Index([log.date for log in logs], name="date")
+
+    for column in ("prices", "trades", "portfolio"):
+        reference = pd.DataFrame([getattr(log, column) for log in logs], index=dates)
+        pd.testing.assert_frame_equal(
+            panels[column], reference.reindex(columns=UNIVERSE), check_column_type=False
+        )
+
+
+def test_float32_weights_keep_prices_float64():
+    buffer = _fill(DailyLogBuffer(UNIVERSE, weight_dtype=np.float32), _daily_logs())
+    panels = buffer.to_panels()
+
+    assert panels["prices"].dtypes.eq(np.float64).all()
+    assert panels["portfolio"].dtypes.eq(np.float32).all()
+
+
+@pytest.mark.parametrize("dtype", ["int64", np.int32, bool])
+def test_rejects_non_float_weight_dtype(dtype):
+    # NaN absence markers would be cast to garbage integers
+    with pytest.raises(ValueError, match="float dtype"):
+        DailyLogBuffer(UNIVERSE, weight_dtype=dtype)
+
+
+def test_append_rejects_symbol_outside_universe():
+    buffer = DailyLogBuffer(UNIVERSE)
+    with pytest.raises(ValueError, match="ZZZ"):
+        buffer.append(
+            pd.Timestamp("2024-01-01"),
+            prices=pd.Series({"AAA": 1.0}),
+            trades=pd.Series({"ZZZ": 0.1}),
+            portfolio=pd.Series({"DDD": 0.2}),
+            feedback={},
+        )
+
+    # The rejected day left nothing behind, not even in the last column
+    assert len(buffer) == 0
+    assert buffer.to_panels()["portfolio"].empty
+
+
+# Reference implementations: the label-aligned pandas versions the array kernels replaced
+
+
+def _reference_reconcile(current: pd.Series, target: pd.Series) -> pd.Series:
+    all_symbols = current.index.union(target.index)
+    delta = target.reindex(all_symbols, fill_value=0.0) - current.reindex(
+        all_symbols, fill_value=0.0
+    )
+    return delta[delta.abs() > 1e-6]
+
+
+def _reference_execution(trades: pd.Series, prices: pd.Series, slippage: float, capital: float):
+    executed = trades[trades.index.isin(prices.index)].copy()
+    fill_prices = pd.Series(index=executed.index, dtype=float)
+    feedback = {}
+    for symbol, weight in executed.items():
+        direction = 1 if weight > 0 else -1
+        fill_price = prices[symbol] * (1 + slippage * direction)
+        notional = weight * capital
+        fill_prices[symbol] = fill_price
+        feedback[symbol] = {
+            "fill_price": fill_price,
+            "slippage": slippage,
+            "notional": notional,
+            "cost": abs(notional * slippage),
+            "direction": "buy" if direction > 0 else "sell",
+        }
+    return executed, fill_prices, feedback
+
+
+def _weights(**weights: float) -> pd.Series:
+    return pd.Series(weights, dtype=float)
+
+
+EMPTY = pd.Series(dtype=float)
+
+RECONCILE_CASES = {
+    "overlapping": (_weights(AAA=0.2, BBB=-0.1), _weights(BBB=0.3, CCC=0.1)),
+    "disjoint": (_weights(AAA=0.2, BBB=-0.1), _weights(CCC=0.3, DDD=0.1)),
+    "same_symbols": (_weights(AAA=0.2, BBB=-0.1), _weights(AAA=0.2, BBB=0.4)),
+    "same_symbols_reordered": (_weights(BBB=-0.1, AAA=0.2), _weights(AAA=0.5, BBB=-0.1)),
+    "below_threshold": (_weights(AAA=0.2), _weights(AAA=0.2 + 1e-7, BBB=1e-8)),
+    "empty_current": (EMPTY, _weights(CCC=0.3, AAA=-0.1, BBB=0.0)),
+    "empty_target": (_weights(CCC=0.3, AAA=-0.1), EMPTY),
+    "both_empty": (EMPTY, EMPTY),
+    "duplicates_same_index": (
+        pd.Series([0.1, 0.2], index=["AAA", "AAA"]),
+        pd.Series([0.3, 0.2], index=["AAA", "AAA"]),
+    ),
+    "duplicates_empty_current": (EMPTY, pd.Series([0.1, 0.2], index=["AAA", "AAA"])),
+    "duplicate_target": (_weights(AAA=0.2), pd.Series([0.1, 0.2], index=["AAA", "AAA"])),
+}
+
+
+@pytest.mark.parametrize("current, target", RECONCILE_CASES.values(), ids=RECONCILE_CASES.keys())
+def test_reconcile_trades_matches_reference(current, target):
+    pd.testing.assert_series_equal(
+        reconcile_trades(current, target), _reference_reconcile(current, target)
+    )
+
+
+def test_reconcile_trades_rejects_duplicate_current_like_reference():
+    current = pd.Series([0.1, 0.2], index=["AAA", "AAA"])
+    target = _weights(AAA=0.2, BBB=0.1)
+
+    with pytest.raises(ValueError, match="duplicate labels"):
+        _reference_reconcile(current, target)
+    with pytest.raises(ValueError, match="duplicate labels"):
+        reconcile_trades(current, target)
+
+
+PRICES = _weights(AAA=10.0, BBB=20.0, CCC=30.0)
+
+EXECUTION_CASES = {
+    "all_priced": (_weights(CCC=0.2, AAA=-0.1), PRICES),
+    "missing_price": (_weights(AAA=0.2, ZZZ=0.5, BBB=-0.3), PRICES),
+    "disjoint": (_weights(XXX=0.2, YYY=-0.1), PRICES),
+    "zero_weight_sells": (_weights(AAA=0.0), PRICES),
+    "empty_trades": (EMPTY, PRICES),
+    "empty_prices": (_weights(AAA=0.2), EMPTY),
+}
+
+
+@pytest.mark.parametrize("trades, prices", EXECUTION_CASES.values(), ids=EXECUTION_CASES.keys())
+def test_simulate_execution_matches_reference(trades, prices):
+    result = simulate_execution(trades, prices, slippage=0.001, capital=1_000.0)
+    executed, fill_prices, feedback = _reference_execution(trades, prices, 0.001, 1_000.0)
+
+    pd.testing.assert_series_equal(result.executed, executed)
+    pd.testing.assert_series_equal(result.fill_prices, fill_prices)
+    assert result.feedback == feedback
+
+
+def test_simulate_execution_fills_duplicate_trades_per_row():
+    trades = pd.Series([0.1, -0.2], index=["AAA", "AAA"])
+    result = simulate_execution(trades, PRICES, slippage=0.001, capital=1_000.0)
+    executed, _, feedback = _reference_execution(trades, PRICES, 0.001, 1_000.0)
+
+    pd.testing.assert_series_equal(result.executed, executed)
+    # Feedback is keyed by symbol, so the last row wins in both implementations
+    assert result.feedback == feedback
+    # The reference wrote fills by label, stamping the last fill on every row;
+    # the positional kernel keeps each row's own buy/sell fill
+    assert result.fill_prices.tolist() == pytest.approx([10.0 * 1.001, 10.0 * 0.999])
@@ -0,0 +1,17 @@
+import logging
+import pickle
+
+from blackbox.utils.logger import RichLogger
+
+
+def test_rich_logger_round_trips_through_pickle(caplog):
+    logger = RichLogger(name="blackbox.pickle_test", log_to_console=True, log_to_file=False)
+
+    restored = pickle.loads(pickle.dumps(logger))
+
+    # Same stdlib logger (pickled by name), fresh console
+    assert restored.get_logger() is logger.get_logger()
+    assert restored.console is not logger.console
+    with caplog.at_level(logging.INFO, logger="blackbox.pickle_test"):
+        restored.info("hello %s", "worker")
+    assert caplog.records[-1].getMessage() == "hello worker"
@@ -0,0 +1,56 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from blackbox.models.execution.market import MarketExecution
+
+
+def _execution(**kwargs) -> MarketExecution:
+    execution = MarketExecution(min_notional=1.0, **kwargs)
+    execution.portfolio_value = 1_000.0
+    return execution
+
+
+def test_update_portfolio_applies_deltas_and_cash():
+    execution = _execution()
+    current = pd.Series({"BBB": 0.1, "AAA": 0.2})
+    # DDD's notional is 0.0005 * 1000 = $0.50, under the $1 minimum
+    trades = pd.Series({"AAA": 0.1, "CCC": 0.3, "DDD": 0.0005})
+
+    updated = execution.update_portfolio(current, trades)
+
+    assert updated.to_dict() == pytest.approx({"AAA": 0.3, "BBB": 0.1, "CCC": 0.3})
+    assert updated.index.tolist() == ["AAA", "BBB", "CCC"]
+    assert "DDD" not in execution.positions.index
+    assert execution.current_cash == pytest.approx(1_000.0 * (1 - 0.7))
+
+
+def test_update_portfolio_drops_closed_positions_and_blocked_shorts():
+    execution = _execution(allow_shorts=False)
+    current = pd.Series({"AAA": 0.2, "BBB": 0.1})
+    trades = pd.Series({"AAA": -0.2, "BBB": -0.3})
+
+    updated = execution.update_portfolio(current, trades)
+
+    # AAA is closed out to zero; BBB would go short and is skipped
+    assert updated.to_dict() == pytest.approx({"BBB": 0.1})
+    assert execution.current_cash == pytest.approx(1_000.0 * (1 - 0.1))
+
+
+def test_mark_to_market_values_positions_and_warns_once_for_missing_prices(caplog):
+    execution = _execution()
+    execution.update_portfolio(
+        pd.Series(dtype=float), pd.Series({"AAA": 0.3, "BBB": 0.1, "CCC": 0.3})
+    )
+    prices = pd.Series({"CCC": 20.0, "AAA": 10.0, "ZZZ": 99.0})
+
+    with caplog.at_level(logging.WARNING, logger="blackbox"):
+        value = execution.mark_to_market(prices)
+
+    # 0.3 * $10 + 0.3 * $20 of positions (BBB unpriced) + $300 cash
+    assert value == pytest.approx(0.3 * 10.0 + 0.3 * 20.0 + 300.0)
+    assert execution.portfolio_value == value
+    warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "1 symbol(s)" in warnings[0] and "BBB" in warnings[0]
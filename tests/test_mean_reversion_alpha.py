@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackbox.models.alpha.mean_reversion import MeanReversionAlphaModel
+
+DATES = pd.bdate_range("2024-01-01", periods=5)
+SYMBOLS = ["AAA", "BBB", "CCC", "DDD"]
+
+
+def _feature_matrix() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    index = pd.MultiIndex.from_product([DATES, SYMBOLS], names=["date", "symbol"])
+    matrix = pd.DataFrame(
+        {
+            "zscore_price_20": rng.normal(size=len(index)),
+            "zscore_volume_20": rng.normal(size=len(index)),
+            "momentum_10": rng.normal(size=len(index)),
+        },
+        index=index,
+    )
+    matrix.iloc[1, :2] = np.nan  # one symbol-day without z-scores
+    matrix.loc[DATES[2]] = 0.0  # an all-zero day is skipped entirely
+    return matrix
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.5])
+def test_generate_batch_matches_per_day_generate(threshold):
+    model = MeanReversionAlphaModel(threshold=threshold)
+    matrix = _feature_matrix()
+    batch = model.generate_batch(matrix)
+    batch_dates = batch.index.get_level_values("date")
+
+    for date in DATES:
+        features = matrix.xs(date, level="date")
+        snapshot = {
+            "date": date,
+            "prices": pd.Series(100.0, index=SYMBOLS),
+            "feature_vector": features,
+        }
+        expected = model.generate(snapshot)
+        got = batch[batch_dates == date].droplevel("date")
+        pd.testing.assert_series_equal(
+            got.sort_index(), expected.sort_index(), check_names=False, check_index_type=False
+        )
+
+
+def test_generate_batch_reflects_in_place_edits():
+    model = MeanReversionAlphaModel(threshold=0.0)
+    matrix = _feature_matrix()
+    model.generate_batch(matrix)
+
+    matrix.iloc[0, :2] = 5.0
+
+    assert model.generate_batch(matrix).iloc[0] == -5.0
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackbox.models.cost.quadratic_market_impact import QuadraticImpact
+
+
+def _reference_adjust(model: QuadraticImpact, target: pd.Series, current: pd.Series) -> pd.Series:
+    """The per-symbol loop the vectorized adjust() replaced."""
+    delta = target.sub(current, fill_value=0.0)
+    adjusted = target.copy()
+    for symbol, weight_change in delta.items():
+        notional = abs(weight_change)
+        commission = max(model.commission_rate * notional, model.min_commission)
+        impact = model.impact_coefficient * (notional**2)
+        total_cost = commission + impact
+        adjusted[symbol] = adjusted.get(symbol, 0.0) - total_cost * (
+            1 if weight_change > 0 else -1
+        )
+    return adjusted
+
+
+CASES = {
+    "rebalance": (pd.Series({"AAA": 0.3, "BBB": -0.2}), pd.Series({"AAA": 0.1, "BBB": 0.1})),
+    # No trade at all: zero notional, so only a minimum commission can bite
+    "zero_change": (pd.Series({"AAA": 0.2, "BBB": 0.1}), pd.Series({"AAA": 0.2, "BBB": 0.1})),
+    "new_entries": (pd.Series({"CCC": 0.4, "AAA": -0.1}), pd.Series(dtype=float)),
+    "full_exit": (pd.Series(dtype=float), pd.Series({"BBB": 0.2, "AAA": -0.1})),
+    "entries_and_exits": (
+        pd.Series({"DDD": 0.2, "AAA": 0.5}),
+        pd.Series({"CCC": -0.3, "AAA": 0.1, "BBB": 0.2}),
+    ),
+    "missing_weight": (pd.Series({"AAA": np.nan, "BBB": 0.2}), pd.Series({"AAA": 0.1})),
+}
+
+
+@pytest.mark.parametrize("min_commission", [0.0, 0.001])
+@pytest.mark.parametrize("target, current", CASES.values(), ids=CASES.keys())
+def test_adjust_matches_per_symbol_loop(target, current, min_commission):
+    model = QuadraticImpact(
+        commission_rate=0.001, impact_coefficient=0.05, min_commission=min_commission
+    )
+
+    pd.testing.assert_series_equal(
+        model.adjust(target, current), _reference_adjust(model, target, current)
+    )
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from math import isclose
+
+import pandas as pd
+import pytest
+
+from blackbox.models.tracker import PositionTracker
+
+
+@dataclass
+class _ReferenceMeta:
+    entry_date: pd.Timestamp
+    weight: float
+
+
+class _ReferenceTracker:
+    """The dict-walking filter/update the vectorized PositionTracker replaced."""
+
+    def __init__(self):
+        self.positions: dict[str, _ReferenceMeta] = {}
+
+    def can_trade(self, symbol, current_date, min_holding):
+        meta = self.positions.get(symbol)
+        if meta is None:
+            return True
+        return (current_date - meta.entry_date).days >= min_holding
+
+    def filter(self, trades, date, min_holding):
+        filtered = {
+            symbol: weight
+            for symbol, weight in trades.items()
+            if weight >= 0 or self.can_trade(symbol, date, min_holding)
+        }
+        return pd.Series(filtered, dtype=float).sort_index()
+
+    def update(self, updated_portfolio, date):
+        for symbol, weight in updated_portfolio.items():
+            existing = self.positions.get(symbol)
+            if existing is None or isclose(existing.weight, 0.0, abs_tol=1e-6):
+                self.positions[symbol] = _ReferenceMeta(entry_date=date, weight=weight)
+            else:
+                existing.weight = weight
+
+        to_remove = [
+            symbol
+            for symbol in self.positions
+            if isclose(updated_portfolio.get(symbol, 0.0), 0.0, abs_tol=1e-6)
+        ]
+        for symbol in to_remove:
+            del self.positions[symbol]
+
+
+def _state(tracker) -> dict:
+    return {symbol: (meta.entry_date, meta.weight) for symbol, meta in tracker.positions.items()}
+
+
+DAYS = pd.bdate_range("2024-01-01", periods=5)
+
+# (trades to filter, portfolio after execution) per day
+SCHEDULE = [
+    (pd.Series({"AAA": 0.2, "BBB": -0.1}), pd.Series({"AAA": 0.2, "BBB": -0.1})),
+    # BBB goes to zero (dropped); AAA is trimmed; CCC is a fresh short
+    (
+        pd.Series({"AAA": -0.05, "BBB": 0.1, "CCC": -0.2}),
+        pd.Series({"AAA": 0.15, "BBB": 0.0, "CCC": -0.2}),
+    ),
+    # AAA vanishes from the book entirely; BBB re-enters with a new entry date
+    (pd.Series({"AAA": -0.15, "BBB": 0.3}), pd.Series({"BBB": 0.3, "CCC": -0.2})),
+    # Sub-tolerance weight counts as an exit
+    (pd.Series({"CCC": 0.2 - 1e-7}), pd.Series({"BBB": 0.3, "CCC": -1e-7})),
+    (pd.Series(dtype=float), pd.Series(dtype=float)),
+]
+
+
+@pytest.mark.parametrize("min_holding", [0, 1, 3])
+def test_filter_and_update_match_loop_reference(min_holding):
+    tracker, reference = PositionTracker(), _ReferenceTracker()
+
+    for date, (trades, portfolio) in zip(DAYS, SCHEDULE, strict=True):
+        pd.testing.assert_series_equal(
+            tracker.filter(trades, date, min_holding),
+            reference.filter(trades, date, min_holding),
+            check_index_type=False,
+        )
+        tracker.update(portfolio, date)
+        reference.update(portfolio, date)
+        assert _state(tracker) == _state(reference)
+
+
+def test_update_removes_symbol_whose_position_goes_to_zero():
+    tracker = PositionTracker()
+    tracker.update(pd.Series({"AAA": 0.2, "BBB": 0.1}), DAYS[0])
+    tracker.update(pd.Series({"AAA": 0.2, "BBB": 0.0}), DAYS[1])
+
+    assert list(tracker.positions) == ["AAA"]
+    assert tracker.positions["AAA"].entry_date == DAYS[0]
+    assert tracker.get_portfolio().to_dict() == {"AAA": 0.2}
+
+
+def test_filter_blocks_shorts_inside_holding_period():
+    tracker = PositionTracker()
+    tracker.update(pd.Series({"AAA": 0.2}), DAYS[0])
+    trades = pd.Series({"AAA": -0.1, "NEW": -0.3, "CCC": 0.4})
+
+    # AAA was entered one business day ago; unheld shorts are always allowed
+    assert tracker.filter(trades, DAYS[1], min_holding=2).to_dict() == {
+        "CCC": 0.4,
+        "NEW": -0.3,
+    }
+    assert tracker.filter(trades, DAYS[2], min_holding=2).index.tolist() == [
+        "AAA",
+        "CCC",
+        "NEW",
+    ]
+
+
+def test_get_portfolio_result_can_be_mutated_safely():
+    tracker = PositionTracker()
+    tracker.update(pd.Series({"AAA": 0.2, "BBB": 0.1}), DAYS[0])
+
+    portfolio = tracker.get_portfolio()
+    portfolio["AAA"] = 0.9
+    portfolio["ZZZ"] = 0.5
+
+    assert tracker.get_portfolio().to_dict() == {"AAA": 0.2, "BBB": 0.1}